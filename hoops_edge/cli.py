@@ -2,29 +2,32 @@
 from __future__ import annotations
 
 import argparse
-from dataclasses import dataclass
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, fields
 from datetime import datetime
+from itertools import chain
+from operator import attrgetter, itemgetter
 from pathlib import Path
-from typing import Dict, Iterable, List, Sequence
+from typing import Callable, Dict, Iterable, List, Sequence, Tuple
 
-from hoops_edge.config import DEFAULT_BOOKS, OUTPUT_DIR, PROPS_MARKETS
-from hoops_edge.config import SUPPORTED_BOOKS
+from hoops_edge.config import DEFAULT_BOOKS, OUTPUT_DIR, PROPS_MARKETS, MarketKind
+from hoops_edge.config import SUPPORTED_BOOKS_SET
 from hoops_edge.ingest.mapping import conference_for_team
-from hoops_edge.ingest.odds_provider import GameOdds, LiveOddsProvider, ReplayOddsProvider
+from hoops_edge.ingest.odds_provider import GameOdds, LiveOddsProvider, MarketOdds, ReplayOddsProvider
 from hoops_edge.ingest.props_provider import DraftKingsPropsProvider
 from hoops_edge.ingest.stats_provider import NBAStatsProvider
 from hoops_edge.models.features import build_game_features
 from hoops_edge.models.pricing import (
     MarketComparison,
-    compare_line_market,
-    compare_probability_market,
+    compare_line_market_batch,
+    compare_probability_market_batch,
 )
 from hoops_edge.models.simulator import simulate_game, simulate_props
 from hoops_edge.output.excel import ExcelWriter
 from hoops_edge.utils import log
 
 
-@dataclass
+@dataclass(slots=True)
 class BetRecord:
     tip: str
     matchup: str
@@ -42,7 +45,7 @@ class BetRecord:
     pulled_at: str
 
 
-@dataclass
+@dataclass(slots=True)
 class AuditRecord:
     game_id: str
     market: str
@@ -61,6 +64,71 @@ class AuditRecord:
     conference: str
 
 
+@dataclass(frozen=True, slots=True)
+class MarketSpec:
+    """Describes how one game market is priced and reported."""
+
+    key: str
+    label: str
+    selection: str
+    side_a: str
+    side_b: str
+    fair_attr: str
+    kind: MarketKind
+    line_price: str
+    implied_b: Callable[[float], float]
+    devig_b: Callable[[float], float]
+
+
+MARKET_SPECS = (
+    MarketSpec(
+        key="ml",
+        label="ML",
+        selection="Home",
+        side_a="home",
+        side_b="away",
+        fair_attr="fair_ml_home",
+        kind=MarketKind.PROB,
+        line_price="Home / {price}",
+        implied_b=lambda value: 1 - value,
+        devig_b=lambda value: 1 - value,
+    ),
+    MarketSpec(
+        key="spread",
+        label="Spread",
+        selection="Home",
+        side_a="home",
+        side_b="away",
+        fair_attr="fair_spread",
+        kind=MarketKind.LINE,
+        line_price="{line} / {price}",
+        implied_b=lambda value: -value,
+        devig_b=lambda value: value,
+    ),
+    MarketSpec(
+        key="total",
+        label="Total",
+        selection="Over",
+        side_a="over",
+        side_b="under",
+        fair_attr="fair_total",
+        kind=MarketKind.LINE,
+        line_price="Over {line} / {price}",
+        implied_b=lambda value: value,
+        devig_b=lambda value: value,
+    ),
+)
+
+
+@dataclass(slots=True)
+class _MarketLeg:
+    game_idx: int
+    game: GameOdds
+    tip: str
+    market: MarketOdds
+    fair_value: float
+
+
 def _is_interactive() -> bool:
     try:
         return bool(__import__("sys").stdin.isatty())
@@ -142,13 +210,36 @@ def _format_percentage(value: float) -> str:
     return f"{value * 100:.1f}%"
 
 
-def _format_diff(value: float, market: str) -> str:
-    if market in {"Spread", "Total"}:
-        return f"{value:.2f}"
-    return _format_percentage(value)
+def _build_prob_bet(
+    matchup: str,
+    tip: str,
+    market: str,
+    selection: str,
+    book: str,
+    line_price: str,
+    comparison: MarketComparison,
+    notes: str = "",
+    pulled_at: str | None = None,
+) -> BetRecord:
+    return BetRecord(
+        tip=tip,
+        matchup=matchup,
+        market=market,
+        selection=selection,
+        book=book,
+        line_price=line_price,
+        fair_value=_format_percentage(comparison.fair_value),
+        book_value=_format_percentage(comparison.book_value),
+        diff=_format_percentage(comparison.diff),
+        edge=_format_percentage(comparison.edge),
+        kelly=_format_percentage(comparison.kelly),
+        risk=comparison.risk,
+        notes=notes,
+        pulled_at=pulled_at or datetime.utcnow().isoformat(timespec="seconds"),
+    )
 
 
-def _build_bet_record(
+def _build_line_bet(
     matchup: str,
     tip: str,
     market: str,
@@ -166,9 +257,9 @@ def _build_bet_record(
         selection=selection,
         book=book,
         line_price=line_price,
-        fair_value=f"{comparison.fair_value:.3f}" if market in {"Spread", "Total"} else _format_percentage(comparison.fair_value),
-        book_value=f"{comparison.book_value:.3f}" if market in {"Spread", "Total"} else _format_percentage(comparison.book_value),
-        diff=_format_diff(comparison.diff, market),
+        fair_value=f"{comparison.fair_value:.3f}",
+        book_value=f"{comparison.book_value:.3f}",
+        diff=f"{comparison.diff:.2f}",
         edge=_format_percentage(comparison.edge),
         kelly=_format_percentage(comparison.kelly),
         risk=comparison.risk,
@@ -177,43 +268,19 @@ def _build_bet_record(
     )
 
 
-def _bet_record_to_row(record: BetRecord) -> List[str]:
-    return [
-        record.tip,
-        record.matchup,
-        record.market,
-        record.selection,
-        record.book,
-        record.line_price,
-        record.fair_value,
-        record.book_value,
-        record.diff,
-        record.edge,
-        record.kelly,
-        record.risk,
-        record.notes,
-        record.pulled_at,
-    ]
-
-
-def _audit_record_to_row(record: AuditRecord) -> List[str]:
-    return [
-        record.game_id,
-        record.market,
-        record.side,
-        record.book,
-        record.line,
-        record.price_a,
-        record.price_b,
-        record.implied_a,
-        record.implied_b,
-        record.devig_a,
-        record.devig_b,
-        record.timestamp,
-        record.source,
-        record.books,
-        record.conference,
-    ]
+_BET_BUILDERS: Dict[MarketKind, Callable[..., BetRecord]] = {
+    MarketKind.PROB: _build_prob_bet,
+    MarketKind.LINE: _build_line_bet,
+}
+
+
+# Row order in the workbook matches the dataclass field order.
+_bet_record_to_row: Callable[[BetRecord], Tuple[str, ...]] = attrgetter(
+    *(field.name for field in fields(BetRecord))
+)
+_audit_record_to_row: Callable[[AuditRecord], Tuple[str, ...]] = attrgetter(
+    *(field.name for field in fields(AuditRecord))
+)
 
 
 def scan(argv: Sequence[str] | None = None) -> None:
@@ -237,7 +304,7 @@ def scan(argv: Sequence[str] | None = None) -> None:
         ",".join(DEFAULT_BOOKS),
     )
     books = _parse_books(books_value)
-    if not set(books).issubset(set(SUPPORTED_BOOKS)):
+    if not SUPPORTED_BOOKS_SET.issuperset(books):
         raise SystemExit("Unsupported book specified")
 
     replay_path = _parse_replay(ns.replay)
@@ -250,12 +317,15 @@ def scan(argv: Sequence[str] | None = None) -> None:
 
     odds = provider.fetch(target_date, books)
 
-    filtered_games = []
-    for game in odds:
-        home_conf = conference_for_team(game.home)
-        away_conf = conference_for_team(game.away)
-        if conference == "all" or home_conf == conference or away_conf == conference:
-            filtered_games.append(game)
+    if conference == "all":
+        filtered_games = odds
+    else:
+        filtered_games = [
+            game
+            for game in odds
+            if conference_for_team(game.home) == conference
+            or conference_for_team(game.away) == conference
+        ]
 
     selected_games = _select_games(filtered_games)
     if not selected_games:
@@ -264,12 +334,6 @@ def scan(argv: Sequence[str] | None = None) -> None:
 
     stats_provider = NBAStatsProvider()
     team_names = {game.home for game in selected_games} | {game.away for game in selected_games}
-    team_stats = stats_provider.fetch_team_stats(team_names)
-
-    picks: List[BetRecord] = []
-    props_rows: List[BetRecord] = []
-    audit_rows: List[AuditRecord] = []
-    summary_rows: List[List[str]] = []
 
     fixture_dirs = [Path("tests/fixtures/props"), Path("hoops_edge/data/fixtures/props")]
     for candidate in fixture_dirs:
@@ -279,16 +343,36 @@ def scan(argv: Sequence[str] | None = None) -> None:
     else:
         props_fixture_dir = None
     props_provider = DraftKingsPropsProvider(props_fixture_dir)
-    props_data = props_provider.fetch([game.game_id for game in selected_games], books[0])
-    player_stats = stats_provider.fetch_player_stats({prop.player for prop in props_data})
 
-    matchup_lookup: Dict[str, str] = {game.game_id: game.home for game in selected_games}
+    # Team stats and props are independent; fetch them concurrently and
+    # only wait on the props before resolving player stats.
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        team_future = executor.submit(stats_provider.fetch_team_stats, team_names)
+        props_future = executor.submit(
+            props_provider.fetch, [game.game_id for game in selected_games], books[0]
+        )
+        props_data = props_future.result()
+        player_stats = stats_provider.fetch_player_stats(set(map(attrgetter("player"), props_data)))
+        team_stats = team_future.result()
 
-    for game in selected_games:
-        tip_dt = _format_tipoff(game.date)
-        tip = f"{tip_dt:%m-%d %I:%M %p}"
+    picks: List[BetRecord] = []
+    props_rows: List[BetRecord] = []
+    audit_rows: List[AuditRecord] = []
+    summary_rows: List[List[str]] = []
+
+    matchup_lookup: Dict[str, str] = {game.game_id: game.home for game in selected_games}
+    matchups: Dict[str, str] = {game.game_id: game.matchup for game in selected_games}
+    tips: Dict[str, str] = {
+        game.game_id: f"{_format_tipoff(game.date):%m-%d %I:%M %p}" for game in selected_games
+    }
+    pulled_at = datetime.utcnow().isoformat(timespec="seconds")
+    books_csv = ",".join(books)
+
+    book_name = books[0]
+    market_legs: List[List[_MarketLeg]] = [[] for _ in MARKET_SPECS]
+    for game_idx, game in enumerate(selected_games):
+        tip = tips[game.game_id]
         matchup = game.matchup
-        book_name = books[0]
         book_markets = game.books.get(book_name, {})
         home_stats = team_stats.get(game.home)
         away_stats = team_stats.get(game.away)
@@ -312,159 +396,110 @@ def scan(argv: Sequence[str] | None = None) -> None:
             ]
         )
 
-        ml_market = book_markets.get("ml")
-        if ml_market and ml_market.prices:
-            home_comp = compare_probability_market(
-                projection.fair_ml_home,
-                ml_market.prices.get("home", -110),
-                ml_market.prices.get("away", -110),
-                "home",
-            )
-            picks.append(
-                _build_bet_record(
-                    matchup=matchup,
-                    tip=tip,
-                    market="ML",
-                    selection="Home",
-                    book=book_name,
-                    line_price=f"Home / {ml_market.prices.get('home', -110)}",
-                    comparison=home_comp,
-                )
-            )
-            audit_rows.append(
-                AuditRecord(
-                    game_id=game.game_id,
-                    market="ML",
-                    side="home",
-                    book=book_name,
-                    line="N/A",
-                    price_a=str(ml_market.prices.get("home", -110)),
-                    price_b=str(ml_market.prices.get("away", -110)),
-                    implied_a=f"{home_comp.fair_value:.3f}",
-                    implied_b=f"{(1-home_comp.fair_value):.3f}",
-                    devig_a=f"{home_comp.book_value:.3f}",
-                    devig_b=f"{(1-home_comp.book_value):.3f}",
-                    timestamp=datetime.utcnow().isoformat(timespec="seconds"),
-                    source=source,
-                    books=",".join(books),
-                    conference=conference,
-                )
-            )
+        for spec, legs in zip(MARKET_SPECS, market_legs):
+            market = book_markets.get(spec.key)
+            if market and market.prices:
+                legs.append(_MarketLeg(game_idx, game, tip, market, getattr(projection, spec.fair_attr)))
 
-        spread_market = book_markets.get("spread")
-        if spread_market and spread_market.prices:
-            comparison = compare_line_market(
-                projection.fair_spread,
-                float(spread_market.line or 0),
-                spread_market.prices.get("home", -110),
-                spread_market.prices.get("away", -110),
-                "home",
-            )
-            picks.append(
-                _build_bet_record(
-                    matchup=matchup,
-                    tip=tip,
-                    market="Spread",
-                    selection="Home",
-                    book=book_name,
-                    line_price=f"{spread_market.line} / {spread_market.prices.get('home', -110)}",
-                    comparison=comparison,
-                )
-            )
-            audit_rows.append(
-                AuditRecord(
-                    game_id=game.game_id,
-                    market="Spread",
-                    side="home",
-                    book=book_name,
-                    line=str(spread_market.line),
-                    price_a=str(spread_market.prices.get("home", -110)),
-                    price_b=str(spread_market.prices.get("away", -110)),
-                    implied_a=f"{comparison.fair_value:.3f}",
-                    implied_b=f"{(-comparison.fair_value):.3f}",
-                    devig_a=f"{comparison.book_value:.3f}",
-                    devig_b=f"{comparison.book_value:.3f}",
-                    timestamp=datetime.utcnow().isoformat(timespec="seconds"),
-                    source=source,
-                    books=",".join(books),
-                    conference=conference,
-                )
-            )
-
-        total_market = book_markets.get("total")
-        if total_market and total_market.prices:
-            comparison = compare_line_market(
-                projection.fair_total,
-                float(total_market.line or 0),
-                total_market.prices.get("over", -110),
-                total_market.prices.get("under", -110),
-                "over",
+    # Price each market type across all games at once, then restore game order.
+    priced: List[Tuple[Tuple[int, int], BetRecord, AuditRecord]] = []
+    for spec_idx, (spec, legs) in enumerate(zip(MARKET_SPECS, market_legs)):
+        if not legs:
+            continue
+        side_a, side_b = spec.side_a, spec.side_b
+        is_line = spec.kind is MarketKind.LINE
+        fair_values = [leg.fair_value for leg in legs]
+        prices_a = [leg.market.prices.get(side_a, -110) for leg in legs]
+        prices_b = [leg.market.prices.get(side_b, -110) for leg in legs]
+        if is_line:
+            comparisons = compare_line_market_batch(
+                fair_values,
+                [float(leg.market.line or 0) for leg in legs],
+                prices_a,
+                prices_b,
+                side_a,
             )
-            picks.append(
-                _build_bet_record(
-                    matchup=matchup,
-                    tip=tip,
-                    market="Total",
-                    selection="Over",
-                    book=book_name,
-                    line_price=f"Over {total_market.line} / {total_market.prices.get('over', -110)}",
-                    comparison=comparison,
-                )
+        else:
+            comparisons = compare_probability_market_batch(fair_values, prices_a, prices_b, side_a)
+        build_bet = _BET_BUILDERS[spec.kind]
+        for leg, price_a, price_b, comparison in zip(legs, prices_a, prices_b, comparisons):
+            line = leg.market.line
+            fair_value = comparison.fair_value
+            book_value = comparison.book_value
+            bet = build_bet(
+                matchup=leg.game.matchup,
+                tip=leg.tip,
+                market=spec.label,
+                selection=spec.selection,
+                book=book_name,
+                line_price=spec.line_price.format(line=line, price=price_a),
+                comparison=comparison,
+                pulled_at=pulled_at,
             )
-            audit_rows.append(
-                AuditRecord(
-                    game_id=game.game_id,
-                    market="Total",
-                    side="over",
-                    book=book_name,
-                    line=str(total_market.line),
-                    price_a=str(total_market.prices.get("over", -110)),
-                    price_b=str(total_market.prices.get("under", -110)),
-                    implied_a=f"{comparison.fair_value:.3f}",
-                    implied_b=f"{comparison.fair_value:.3f}",
-                    devig_a=f"{comparison.book_value:.3f}",
-                    devig_b=f"{comparison.book_value:.3f}",
-                    timestamp=datetime.utcnow().isoformat(timespec="seconds"),
-                    source=source,
-                    books=",".join(books),
-                    conference=conference,
-                )
+            audit = AuditRecord(
+                game_id=leg.game.game_id,
+                market=spec.label,
+                side=side_a,
+                book=book_name,
+                line=str(line) if is_line else "N/A",
+                price_a=str(price_a),
+                price_b=str(price_b),
+                implied_a=f"{fair_value:.3f}",
+                implied_b=f"{spec.implied_b(fair_value):.3f}",
+                devig_a=f"{book_value:.3f}",
+                devig_b=f"{spec.devig_b(book_value):.3f}",
+                timestamp=pulled_at,
+                source=source,
+                books=books_csv,
+                conference=conference,
             )
+            priced.append(((leg.game_idx, spec_idx), bet, audit))
+    priced.sort(key=itemgetter(0))
+    for _, bet, audit in priced:
+        picks.append(bet)
+        audit_rows.append(audit)
 
     prop_projections = simulate_props(props_data, player_stats, team_stats, matchup_lookup)
-    for prop, projection in zip(props_data, prop_projections):
-        comparison = compare_probability_market(
-            projection.fair_probability_over,
-            prop.over,
-            prop.under,
-            "over",
-        )
-        record = _build_bet_record(
-            matchup=next((g.matchup for g in selected_games if g.game_id == prop.game_id), prop.game_id),
-            tip=f"{tip_dt:%m-%d %I:%M %p}",
+    # simulate_props skips props without stats, so price only the props it kept.
+    kept_props = [projection.prop for projection in prop_projections]
+    prop_comparisons = compare_probability_market_batch(
+        [projection.fair_probability_over for projection in prop_projections],
+        [prop.over for prop in kept_props],
+        [prop.under for prop in kept_props],
+        "over",
+    )
+    for projection, comparison in zip(prop_projections, prop_comparisons):
+        prop = projection.prop
+        game_id = prop.game_id
+        fair_prob = projection.fair_probability_over
+        book_prob = comparison.book_value
+        record = _build_prob_bet(
+            matchup=matchups.get(game_id, game_id),
+            tip=tips.get(game_id, ""),
             market=prop.market.capitalize(),
             selection=f"{prop.player} • Over",
             book=prop.book,
             line_price=f"Over {prop.line} / {prop.over}",
             comparison=comparison,
+            pulled_at=pulled_at,
         )
         props_rows.append(record)
         audit_rows.append(
             AuditRecord(
-                game_id=prop.game_id,
+                game_id=game_id,
                 market=f"Prop-{prop.market}",
                 side="over",
                 book=prop.book,
                 line=str(prop.line),
                 price_a=str(prop.over),
                 price_b=str(prop.under),
-                implied_a=f"{projection.fair_probability_over:.3f}",
-                implied_b=f"{1-projection.fair_probability_over:.3f}",
-                devig_a=f"{comparison.book_value:.3f}",
-                devig_b=f"{(1-comparison.book_value):.3f}",
-                timestamp=datetime.utcnow().isoformat(timespec="seconds"),
+                implied_a=f"{fair_prob:.3f}",
+                implied_b=f"{1-fair_prob:.3f}",
+                devig_a=f"{book_prob:.3f}",
+                devig_b=f"{(1-book_prob):.3f}",
+                timestamp=pulled_at,
                 source=source,
-                books=",".join(books),
+                books=books_csv,
                 conference=conference,
             )
         )
@@ -473,15 +508,15 @@ def scan(argv: Sequence[str] | None = None) -> None:
     output_path = excel_writer.write(
         target_date,
         conference,
-        [_bet_record_to_row(bet) for bet in picks],
-        [_bet_record_to_row(bet) for bet in props_rows],
+        (_bet_record_to_row(bet) for bet in picks),
+        (_bet_record_to_row(bet) for bet in props_rows),
         summary_rows,
-        [_audit_record_to_row(audit) for audit in audit_rows],
+        (_audit_record_to_row(audit) for audit in audit_rows),
     )
 
     total_bets = len(picks) + len(props_rows)
     risk_counts = {"Low": 0, "Med": 0, "High": 0}
-    for bet in picks + props_rows:
+    for bet in chain(picks, props_rows):
         risk_counts[bet.risk] = risk_counts.get(bet.risk, 0) + 1
 
     log.success(
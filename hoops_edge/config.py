@@ -3,7 +3,11 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from datetime import timedelta
-from typing import Dict, List
+from enum import IntEnum
+from typing import Dict, FrozenSet, List, Tuple
+
+
+RISK_LABELS: Tuple[str, str, str] = ("Low", "Med", "High")
 
 
 @dataclass(frozen=True)
@@ -11,23 +15,22 @@ class RiskThresholds:
     low: float
     medium: float
 
-    def classify_prob(self, diff: float) -> str:
-        if diff <= self.low:
-            return "Low"
-        if diff <= self.medium:
-            return "Med"
-        return "High"
+    @property
+    def cutoffs(self) -> Tuple[float, float]:
+        """Inclusive upper bounds of the Low and Med bands, for bisection."""
+        return (self.low, self.medium)
+
+
+class MarketKind(IntEnum):
+    """How a market's fair and book values are expressed."""
 
-    def classify_line(self, diff: float) -> str:
-        if diff <= self.low:
-            return "Low"
-        if diff <= self.medium:
-            return "Med"
-        return "High"
+    PROB = 0
+    LINE = 1
 
 
 DEFAULT_BOOKS: List[str] = ["DK"]
 SUPPORTED_BOOKS: List[str] = ["DK", "FD"]
+SUPPORTED_BOOKS_SET: FrozenSet[str] = frozenset(SUPPORTED_BOOKS)
 
 PROBABILITY_THRESHOLDS = RiskThresholds(low=0.02, medium=0.05)
 LINE_THRESHOLDS = RiskThresholds(low=0.5, medium=1.5)
@@ -1,19 +1,32 @@
 """Utilities for canonicalising team and player names."""
 from __future__ import annotations
 
-from typing import Dict
+import sys
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Dict, Mapping
 
 
-TEAM_ALIASES: Dict[str, str] = {
+def _interned(table: Dict[str, str]) -> Mapping[str, str]:
+    """Freeze *table* with interned keys and values.
+
+    Team names parsed from odds payloads are interned as well, so lookups
+    on hits resolve by identity rather than a full string comparison.
+    """
+    return MappingProxyType({sys.intern(k): sys.intern(v) for k, v in table.items()})
+
+
+# Both tables are read-only: the lookups below are memoised.
+TEAM_ALIASES: Mapping[str, str] = _interned({
     "BOS": "Boston Celtics",
     "Boston": "Boston Celtics",
     "NYK": "New York Knicks",
     "New York": "New York Knicks",
     "Knicks": "New York Knicks",
     "Celtics": "Boston Celtics",
-}
+})
 
-TEAM_CONFERENCES: Dict[str, str] = {
+TEAM_CONFERENCES: Mapping[str, str] = _interned({
     "Atlanta Hawks": "east",
     "Boston Celtics": "east",
     "Brooklyn Nets": "east",
@@ -44,14 +57,16 @@ TEAM_CONFERENCES: Dict[str, str] = {
     "Toronto Raptors": "east",
     "Utah Jazz": "west",
     "Washington Wizards": "east",
-}
+})
 
 
+@lru_cache(maxsize=128)
 def canonical_team(name: str) -> str:
     """Return the canonical team name for *name*."""
     name = name.strip()
-    return TEAM_ALIASES.get(name, name)
+    return sys.intern(TEAM_ALIASES.get(name, name))
 
 
+@lru_cache(maxsize=128)
 def conference_for_team(team: str) -> str:
     return TEAM_CONFERENCES.get(team, "all")
@@ -1,21 +1,22 @@
 """Odds provider interfaces."""
 from __future__ import annotations
 
+import sys
 from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, Iterable, List, Optional
+from typing import Any, Dict, Iterable, List, Optional
 
-import json
+from hoops_edge.utils.jsonio import load_path
 
 
-@dataclass
+@dataclass(slots=True)
 class MarketOdds:
     line: Optional[float]
     prices: Dict[str, int]
 
 
-@dataclass
+@dataclass(slots=True)
 class GameOdds:
     game_id: str
     date: datetime
@@ -28,6 +29,13 @@ class GameOdds:
         return f"{self.away} @ {self.home}"
 
 
+def _parse_market(value: Any) -> MarketOdds:
+    if not isinstance(value, dict):
+        return MarketOdds(line=None, prices={})
+    prices = {side: int(price) for side, price in value.items() if side != "line"}
+    return MarketOdds(line=value.get("line"), prices=prices)
+
+
 class OddsProvider:
     """Base class for odds providers."""
 
@@ -42,43 +50,26 @@ class ReplayOddsProvider(OddsProvider):
         self.fixture_path = fixture_path
 
     def fetch(self, date: datetime, books: Iterable[str]) -> List[GameOdds]:
-        with self.fixture_path.open("r", encoding="utf-8") as f:
-            payload = json.load(f)
+        payload = load_path(self.fixture_path)
 
         if isinstance(payload, dict):
             payload = [payload]
 
-        results: List[GameOdds] = []
-        for game in payload:
-            game_books: Dict[str, Dict[str, MarketOdds]] = {}
-            for book_name, markets in game.get("books", {}).items():
-                if book_name not in books:
-                    continue
-                book_markets: Dict[str, MarketOdds] = {}
-                for market_key, market_value in markets.items():
-                    if isinstance(market_value, dict):
-                        line = market_value.get("line")
-                        prices = {
-                            side: int(price)
-                            for side, price in market_value.items()
-                            if side != "line"
-                        }
-                    else:
-                        line = None
-                        prices = {}
-                    book_markets[market_key] = MarketOdds(line=line, prices=prices)
-                if book_markets:
-                    game_books[book_name] = book_markets
-            results.append(
-                GameOdds(
-                    game_id=game["game_id"],
-                    date=datetime.fromisoformat(game["date"]),
-                    home=game["home"],
-                    away=game["away"],
-                    books=game_books,
-                )
+        wanted = set(books)
+        return [
+            GameOdds(
+                game_id=game["game_id"],
+                date=datetime.fromisoformat(game["date"]),
+                home=sys.intern(game["home"]),
+                away=sys.intern(game["away"]),
+                books={
+                    book_name: {key: _parse_market(value) for key, value in markets.items()}
+                    for book_name, markets in game.get("books", {}).items()
+                    if book_name in wanted and markets
+                },
             )
-        return results
+            for game in payload
+        ]
 
 
 class LiveOddsProvider(OddsProvider):
@@ -1,14 +1,17 @@
 """DraftKings props provider."""
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Iterable, List
+from typing import Any, Dict, Iterable, List, Optional
 
-import json
+from hoops_edge.utils.jsonio import load_path
 
+_MAX_FIXTURE_WORKERS = 8
 
-@dataclass
+
+@dataclass(slots=True)
 class PlayerProp:
     game_id: str
     player: str
@@ -28,17 +31,25 @@ class DraftKingsPropsProvider(PropsProvider):
     def __init__(self, fixture_dir: Path | None = None) -> None:
         self.fixture_dir = fixture_dir
 
+    def _load_fixture(self, game_id: str) -> Optional[Dict[str, Any]]:
+        try:
+            return load_path(self.fixture_dir / f"{game_id}.json")
+        except FileNotFoundError:
+            return None
+
     def fetch(self, game_ids: Iterable[str], book: str) -> List[PlayerProp]:
         if self.fixture_dir is None:
             return []
 
+        game_ids = list(game_ids)
+        workers = max(1, min(_MAX_FIXTURE_WORKERS, len(game_ids)))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            payloads = list(executor.map(self._load_fixture, game_ids))
+
         props: List[PlayerProp] = []
-        for game_id in game_ids:
-            fixture = self.fixture_dir / f"{game_id}.json"
-            if not fixture.exists():
+        for game_id, payload in zip(game_ids, payloads):
+            if payload is None:
                 continue
-            with fixture.open("r", encoding="utf-8") as f:
-                payload = json.load(f)
             for prop in payload.get("props", []):
                 if prop.get("book", book) != book:
                     continue
@@ -5,7 +5,7 @@ from dataclasses import dataclass
 from typing import Dict, Iterable
 
 
-@dataclass
+@dataclass(slots=True)
 class TeamStats:
     team: str
     pace: float
@@ -18,7 +18,7 @@ class TeamStats:
     recent_record: str
 
 
-@dataclass
+@dataclass(slots=True)
 class PlayerStats:
     player: str
     minutes: float
@@ -29,6 +29,13 @@ class PlayerStats:
     threes: float
 
 
+def _name_seed(name: str) -> int:
+    """Sum of the code points in *name*, computed in C where possible."""
+    if name.isascii():
+        return sum(name.encode("ascii"))
+    return sum(map(ord, name))
+
+
 class StatsProvider:
     def fetch_team_stats(self, teams: Iterable[str]) -> Dict[str, TeamStats]:
         raise NotImplementedError
@@ -43,7 +50,7 @@ class NBAStatsProvider(StatsProvider):
     def fetch_team_stats(self, teams: Iterable[str]) -> Dict[str, TeamStats]:
         results: Dict[str, TeamStats] = {}
         for team in teams:
-            base = sum(ord(c) for c in team) % 10
+            base = _name_seed(team) % 10
             results[team] = TeamStats(
                 team=team,
                 pace=95 + base,
@@ -60,7 +67,7 @@ class NBAStatsProvider(StatsProvider):
     def fetch_player_stats(self, players: Iterable[str]) -> Dict[str, PlayerStats]:
         results: Dict[str, PlayerStats] = {}
         for player in players:
-            base = sum(ord(c) for c in player) % 12
+            base = _name_seed(player) % 12
             results[player] = PlayerStats(
                 player=player,
                 minutes=28 + base,
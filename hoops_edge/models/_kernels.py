@@ -0,0 +1,23 @@
+"""Batch numeric kernels used by the simulators."""
+from __future__ import annotations
+
+from array import array
+from math import erfc, sqrt
+from typing import Sequence
+
+_SQRT2 = sqrt(2)
+
+
+def fair_over_probabilities(
+    means: Sequence[float], sigmas: Sequence[float], lines: Sequence[float]
+) -> array:
+    """Return P(X > line) for X ~ N(mean, sigma), one entry per prop.
+
+    The survival function is evaluated directly as ``0.5 * erfc(z)``,
+    which avoids the cancellation in ``1 - cdf`` for lines far below
+    the mean. The logistic approximation ``1 / (1 + exp(1.702 z))`` is
+    only ~25% cheaper here and is off by up to 0.95 percentage points,
+    about half the Low risk band, so the exact form is kept.
+    """
+    scaled = [(line - mean) / (sigma * _SQRT2) for mean, sigma, line in zip(means, sigmas, lines)]
+    return array("d", [0.5 * tail for tail in map(erfc, scaled)])
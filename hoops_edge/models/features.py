@@ -2,18 +2,19 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from typing import Callable, Dict, List, Sequence
 
 from hoops_edge.ingest.stats_provider import PlayerStats, TeamStats
 
 
-@dataclass
+@dataclass(slots=True)
 class GameFeatures:
     home: TeamStats
     away: TeamStats
     pace: float
 
 
-@dataclass
+@dataclass(slots=True)
 class PlayerFeatures:
     stats: PlayerStats
     opponent_def_rating: float
@@ -35,18 +36,46 @@ def build_player_features(
     )
 
 
+def _project_points(features: PlayerFeatures) -> float:
+    return features.stats.points * (features.opponent_pace / 100)
+
+
+def _project_rebounds(features: PlayerFeatures) -> float:
+    return features.stats.rebounds * (100 / features.opponent_def_rating)
+
+
+def _project_assists(features: PlayerFeatures) -> float:
+    return features.stats.assists * (features.opponent_pace / 98)
+
+
+def _project_threes(features: PlayerFeatures) -> float:
+    return features.stats.threes * (features.opponent_pace / 100)
+
+
+def _project_pra(features: PlayerFeatures) -> float:
+    return _project_points(features) + _project_rebounds(features) + _project_assists(features)
+
+
+def _project_default(features: PlayerFeatures) -> float:
+    return features.stats.points
+
+
+_PROJECTORS: Dict[str, Callable[[PlayerFeatures], float]] = {
+    "points": _project_points,
+    "rebounds": _project_rebounds,
+    "assists": _project_assists,
+    "threes": _project_threes,
+    "pra": _project_pra,
+}
+
+
 def project_player_mean(features: PlayerFeatures, market: str) -> float:
-    base = features.stats
-    if market == "points":
-        return base.points * (features.opponent_pace / 100)
-    if market == "rebounds":
-        return base.rebounds * (100 / features.opponent_def_rating)
-    if market == "assists":
-        return base.assists * (features.opponent_pace / 98)
-    if market == "threes":
-        return base.threes * (features.opponent_pace / 100)
-    if market == "pra":
-        return project_player_mean(features, "points") + project_player_mean(
-            features, "rebounds"
-        ) + project_player_mean(features, "assists")
-    return base.points
+    return _PROJECTORS.get(market, _project_default)(features)
+
+
+def project_player_means(features: Sequence[PlayerFeatures], market: str) -> List[float]:
+    """Project every entry of *features* for a single *market*.
+
+    The market is resolved to its projector once for the whole batch.
+    """
+    return list(map(_PROJECTORS.get(market, _project_default), features))
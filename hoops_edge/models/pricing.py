@@ -1,18 +1,37 @@
 """Pricing utilities for odds conversion and risk assessment."""
 from __future__ import annotations
 
+from bisect import bisect_left
 from dataclasses import dataclass
-from typing import Dict, Tuple
+from itertools import repeat
+from typing import Dict, List, Sequence, Tuple
 
-from hoops_edge.config import KELLY_CAP, LINE_THRESHOLDS, PROBABILITY_THRESHOLDS
+from hoops_edge.config import KELLY_CAP, LINE_THRESHOLDS, PROBABILITY_THRESHOLDS, RISK_LABELS
 
 
-def american_to_probability(odds: int) -> float:
+def _american_to_probability(odds: int) -> float:
     if odds < 0:
         return -odds / (-odds + 100)
     return 100 / (odds + 100)
 
 
+def _american_to_decimal(odds: int) -> float:
+    if odds > 0:
+        return 1 + odds / 100
+    return 1 + 100 / -odds
+
+
+# Quoted prices almost always fall within +/-1000, so conversions for that
+# range are precomputed; anything else (or non-integral odds) is computed.
+_TABLE_ODDS = range(-1000, 1001)
+_PROBABILITY_TABLE: Dict[int, float] = {odds: _american_to_probability(odds) for odds in _TABLE_ODDS}
+_DECIMAL_TABLE: Dict[int, float] = {odds: _american_to_decimal(odds) for odds in _TABLE_ODDS if odds}
+
+
+def american_to_probability(odds: int) -> float:
+    return _PROBABILITY_TABLE.get(odds) or _american_to_probability(odds)
+
+
 def probability_to_american(prob: float) -> int:
     prob = max(1e-6, min(0.999999, prob))
     if prob > 0.5:
@@ -21,9 +40,7 @@ def probability_to_american(prob: float) -> int:
 
 
 def american_to_decimal(odds: int) -> float:
-    if odds > 0:
-        return 1 + odds / 100
-    return 1 + 100 / -odds
+    return _DECIMAL_TABLE.get(odds) or _american_to_decimal(odds)
 
 
 def devig_two_way(price_a: int, price_b: int) -> Tuple[float, float]:
@@ -35,26 +52,37 @@ def devig_two_way(price_a: int, price_b: int) -> Tuple[float, float]:
     return p_a_raw / total, p_b_raw / total
 
 
+# Public helper only; the comparisons compute edge inline.
 def edge_percentage(model_prob: float, book_prob: float) -> float:
     return model_prob - book_prob
 
 
+_PROB_CUTOFFS = PROBABILITY_THRESHOLDS.cutoffs
+_LINE_CUTOFFS = LINE_THRESHOLDS.cutoffs
+
+
 def classify_risk(diff: float, is_line: bool = False) -> str:
-    thresholds = LINE_THRESHOLDS if is_line else PROBABILITY_THRESHOLDS
-    return thresholds.classify_line(diff) if is_line else thresholds.classify_prob(diff)
+    # NaN compares false against every cutoff; treat it as the riskiest band.
+    if diff != diff:
+        return RISK_LABELS[-1]
+    # bisect_left keeps the bands inclusive: a diff equal to a cutoff stays in the lower band.
+    return RISK_LABELS[bisect_left(_LINE_CUTOFFS if is_line else _PROB_CUTOFFS, diff)]
 
 
 def kelly_fraction(model_prob: float, odds: int) -> float:
-    decimal = american_to_decimal(odds)
-    b = decimal - 1
-    q = 1 - model_prob
+    b = american_to_decimal(odds) - 1
     if b == 0:
         return 0
-    kelly = (model_prob * (decimal - 1) - q) / b
-    return max(0.0, min(KELLY_CAP, kelly))
+    return max(0.0, min(KELLY_CAP, (model_prob * b - (1 - model_prob)) / b))
+
+
+# Sides priced off the first quote of a two-way market. Line markets only ever
+# pass home/away or over/under, so "yes" is deliberately probability-only.
+_PROB_A_SIDES = frozenset({"over", "home", "yes"})
+_LINE_A_SIDES = frozenset({"home", "over"})
 
 
-@dataclass
+@dataclass(slots=True)
 class MarketComparison:
     fair_value: float
     book_value: float
@@ -65,45 +93,61 @@ class MarketComparison:
 
 
 def compare_probability_market(model_prob: float, price_a: int, price_b: int, side: str) -> MarketComparison:
-    book_probs = devig_two_way(price_a, price_b)
-    if side == "over" or side == "home" or side == "yes":
-        book_prob = book_probs[0]
+    # De-vig, edge and Kelly are fused here: only the chosen side is normalised
+    # and no intermediate tuples are built.
+    p_a = american_to_probability(price_a)
+    p_b = american_to_probability(price_b)
+    total = p_a + p_b
+    if side in _PROB_A_SIDES:
+        book_prob = p_a / total if total else 0.5
         odds = price_a
     else:
-        book_prob = book_probs[1]
+        book_prob = p_b / total if total else 0.5
         odds = price_b
     diff = abs(model_prob - book_prob)
-    risk = classify_risk(diff, is_line=False)
-    edge = edge_percentage(model_prob, book_prob)
-    kelly = kelly_fraction(model_prob, odds)
     return MarketComparison(
         fair_value=model_prob,
         book_value=book_prob,
         diff=diff,
-        edge=edge,
-        kelly=kelly,
-        risk=risk,
+        edge=model_prob - book_prob,
+        kelly=kelly_fraction(model_prob, odds),
+        risk=classify_risk(diff, is_line=False),
     )
 
 
 def compare_line_market(model_line: float, book_line: float, price_a: int, price_b: int, side: str) -> MarketComparison:
     diff = abs(model_line - book_line)
-    risk = classify_risk(diff, is_line=True)
-    if side == "home" or side == "over":
-        odds = price_a
-    else:
-        odds = price_b
     # Edge is computed as advantage vs chosen side probability assuming half point value
-    model_prob = 0.5 + (model_line - book_line) / 10
-    model_prob = max(0.01, min(0.99, model_prob))
-    book_prob = devig_two_way(price_a, price_b)[0]
-    edge = edge_percentage(model_prob, book_prob)
-    kelly = kelly_fraction(model_prob, odds)
+    model_prob = max(0.01, min(0.99, 0.5 + (model_line - book_line) / 10))
+    p_a = american_to_probability(price_a)
+    total = p_a + american_to_probability(price_b)
+    book_prob = p_a / total if total else 0.5
     return MarketComparison(
         fair_value=model_line,
         book_value=book_line,
         diff=diff,
-        edge=edge,
-        kelly=kelly,
-        risk=risk,
+        edge=model_prob - book_prob,
+        kelly=kelly_fraction(model_prob, price_a if side in _LINE_A_SIDES else price_b),
+        risk=classify_risk(diff, is_line=True),
     )
+
+
+def compare_probability_market_batch(
+    model_probs: Sequence[float],
+    prices_a: Sequence[int],
+    prices_b: Sequence[int],
+    side: str,
+) -> List[MarketComparison]:
+    """Column-wise :func:`compare_probability_market` over parallel sequences."""
+    return list(map(compare_probability_market, model_probs, prices_a, prices_b, repeat(side)))
+
+
+def compare_line_market_batch(
+    model_lines: Sequence[float],
+    book_lines: Sequence[float],
+    prices_a: Sequence[int],
+    prices_b: Sequence[int],
+    side: str,
+) -> List[MarketComparison]:
+    """Column-wise :func:`compare_line_market` over parallel sequences."""
+    return list(map(compare_line_market, model_lines, book_lines, prices_a, prices_b, repeat(side)))
@@ -1,23 +1,25 @@
 """Simple simulators for games and props."""
 from __future__ import annotations
 
+from array import array
 from dataclasses import dataclass
 from math import erf, sqrt
 from typing import Dict, Iterable, List
 
 from hoops_edge.ingest.props_provider import PlayerProp
 from hoops_edge.ingest.stats_provider import PlayerStats, TeamStats
+from hoops_edge.models._kernels import fair_over_probabilities
 from hoops_edge.models.features import (
     GameFeatures,
     PlayerFeatures,
     build_game_features,
     build_player_features,
-    project_player_mean,
+    project_player_means,
 )
 from hoops_edge.models.pricing import american_to_decimal, probability_to_american
 
 
-@dataclass
+@dataclass(slots=True)
 class GameProjection:
     game_id: str
     home_score: float
@@ -28,10 +30,9 @@ class GameProjection:
     fair_total: float
 
 
-@dataclass
+@dataclass(slots=True)
 class PropProjection:
-    player: str
-    market: str
+    prop: PlayerProp
     fair_mean: float
     fair_probability_over: float
 
@@ -74,22 +75,32 @@ def simulate_props(
     team_stats: Dict[str, TeamStats],
     matchup_lookup: Dict[str, str],
 ) -> List[PropProjection]:
-    projections: List[PropProjection] = []
+    valid: List[PlayerProp] = []
+    features: List[PlayerFeatures] = []
+    by_market: Dict[str, List[int]] = {}
     for prop in props:
         player = player_stats.get(prop.player)
         opponent_team = team_stats.get(matchup_lookup.get(prop.game_id, ""))
         if not player or not opponent_team:
             continue
-        features = build_player_features(player, opponent_team)
-        mean = project_player_mean(features, prop.market)
-        std = max(1.5, mean * 0.18)
-        fair_prob = 1 - normal_cdf(prop.line, mean, std)
-        projections.append(
-            PropProjection(
-                player=prop.player,
-                market=prop.market,
-                fair_mean=mean,
-                fair_probability_over=fair_prob,
-            )
+        by_market.setdefault(prop.market, []).append(len(valid))
+        valid.append(prop)
+        features.append(build_player_features(player, opponent_team))
+
+    means = array("d", [0.0]) * len(valid)
+    for market, indices in by_market.items():
+        market_means = project_player_means([features[idx] for idx in indices], market)
+        for idx, mean in zip(indices, market_means):
+            means[idx] = mean
+    sigmas = array("d", [max(1.5, mean * 0.18) for mean in means])
+    lines = array("d", [prop.line for prop in valid])
+
+    fair_probs = fair_over_probabilities(means, sigmas, lines)
+    return [
+        PropProjection(
+            prop=prop,
+            fair_mean=mean,
+            fair_probability_over=fair_prob,
         )
-    return projections
+        for prop, mean, fair_prob in zip(valid, means, fair_probs)
+    ]
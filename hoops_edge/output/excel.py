@@ -2,10 +2,12 @@
 from __future__ import annotations
 
 from datetime import datetime
+from itertools import islice, zip_longest
+from math import isfinite
 from pathlib import Path
-from typing import Iterable, List, Sequence
+from typing import Iterable, Iterator, List, Sequence, Tuple
 from xml.etree.ElementTree import Element, SubElement, tostring
-from zipfile import ZipFile
+from zipfile import ZIP_DEFLATED, ZipFile
 
 from hoops_edge.config import OUTPUT_DIR
 
@@ -61,6 +63,30 @@ AUDIT_HEADERS = [
 ]
 
 
+_SHEET_DATA_PLACEHOLDER = b"<sheetData />"
+
+# Conditional formatting is identical on every Picks/Props sheet: risk fills
+# on column L (dxf 0-2 in styles.xml) and a colour scale on the diff column I.
+_RISK_CF_XML = (
+    b'<conditionalFormatting sqref="L2:L1048576">'
+    b'<cfRule type="containsText" operator="containsText" text="Low" dxfId="0" priority="1">'
+    b'<formula>NOT(ISERROR(SEARCH("Low",$L2)))</formula></cfRule>'
+    b'<cfRule type="containsText" operator="containsText" text="Med" dxfId="1" priority="2">'
+    b'<formula>NOT(ISERROR(SEARCH("Med",$L2)))</formula></cfRule>'
+    b'<cfRule type="containsText" operator="containsText" text="High" dxfId="2" priority="3">'
+    b'<formula>NOT(ISERROR(SEARCH("High",$L2)))</formula></cfRule>'
+    b"</conditionalFormatting>"
+)
+_DIFF_CF_XML = (
+    b'<conditionalFormatting sqref="I2:I1048576">'
+    b'<cfRule type="colorScale" priority="4"><colorScale>'
+    b'<cfvo type="percentile" val="10" /><cfvo type="percentile" val="50" />'
+    b'<cfvo type="percentile" val="90" />'
+    b'<color rgb="FFFFFFFF" /><color rgb="FFFFF2CC" /><color rgb="FFFFC000" />'
+    b"</colorScale></cfRule></conditionalFormatting>"
+)
+
+
 def _column_letter(idx: int) -> str:
     result = ""
     while idx > 0:
@@ -69,25 +95,97 @@ def _column_letter(idx: int) -> str:
     return result
 
 
-def _auto_width(rows: List[Sequence]) -> List[float]:
-    widths: List[float] = []
-    for row in rows:
-        for idx, value in enumerate(row, start=1):
-            text = "" if value is None else str(value)
-            width = min(45, len(text) + 2)
-            if idx > len(widths):
-                widths.append(width)
-            else:
-                widths[idx - 1] = max(widths[idx - 1], width)
-    return widths
+def _column_letters(count: int) -> Tuple[bytes, ...]:
+    return tuple(_column_letter(idx).encode("ascii") for idx in range(1, count + 1))
+
+
+# Cell references for the first 64 columns; wider rows fall back to _column_letter.
+_COL_LETTERS = _column_letters(64)
+
+
+def _cell_text(value: object) -> str | bytes:
+    """Return text for an inline string cell, or ASCII bytes for a numeric one."""
+    kind = type(value)
+    if kind is str:
+        return value
+    if value is None:
+        return ""
+    # bool is an int subclass; write it as "True"/"False" text rather than 1/0.
+    if kind is int or (kind is float and isfinite(value)):
+        return repr(value).encode("ascii")
+    return str(value)
+
+
+def _stringify(headers: Sequence[str], rows: Iterable[Sequence]) -> List[Tuple[str | bytes, ...]]:
+    """Convert the header and every row to cell text in a single pass."""
+    stringified: List[Tuple[str | bytes, ...]] = [tuple(headers)]
+    stringified.extend(tuple(map(_cell_text, row)) for row in rows)
+    return stringified
+
+
+def _auto_width(text_rows: List[Tuple[str | bytes, ...]]) -> List[float]:
+    return [min(45, max(map(len, column)) + 2) for column in zip_longest(*text_rows, fillvalue="")]
+
+
+def _escape_text(text: str) -> str:
+    return text.replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;")
+
+
+_TEXT_CELL = b'<c r="%s%d" t="inlineStr"><is><t>%s</t></is></c>'
+_NUMBER_CELL = b'<c r="%s%d"><v>%s</v></c>'
 
 
-def _build_sheet_xml(title: str, rows: List[Sequence], add_risk_rules: bool, add_diff_scale: bool) -> bytes:
+def _row_xml(row_idx: int, row_values: Tuple[str | bytes, ...]) -> bytes:
+    if len(row_values) <= len(_COL_LETTERS):
+        letters = _COL_LETTERS
+    else:
+        letters = _column_letters(len(row_values))
+    # One join per row instead of growing a bytearray cell by cell.
+    parts = [b'<row r="%d">' % row_idx]
+    # Empty cells are omitted; XLSX readers treat missing cells as blank.
+    for letter, text in zip(letters, row_values):
+        if type(text) is str:
+            if text:
+                parts.append(_TEXT_CELL % (letter, row_idx, _escape_text(text).encode("utf-8")))
+        else:
+            parts.append(_NUMBER_CELL % (letter, row_idx, text))
+    parts.append(b"</row>")
+    return b"".join(parts)
+
+
+# Header rows of the stock sheets, encoded once; keyed by the stringified header tuple.
+_HEADER_ROW_XML = {
+    tuple(headers): _row_xml(1, tuple(headers))
+    for headers in (PICKS_HEADERS, PROPS_HEADERS, GAME_SUMMARY_HEADERS, AUDIT_HEADERS)
+}
+
+
+def _iter_sheet_data(rows: List[Tuple[str | bytes, ...]]) -> Iterator[bytes]:
+    yield b"<sheetData>"
+    if rows:
+        header = rows[0]
+        yield _HEADER_ROW_XML.get(header) or _row_xml(1, header)
+    for row_idx, row_values in enumerate(islice(rows, 1, None), start=2):
+        yield _row_xml(row_idx, row_values)
+    yield b"</sheetData>"
+
+
+def _iter_sheet_xml_chunks(
+    title: str,
+    headers: Sequence[str],
+    rows: Iterable[Sequence],
+    add_risk_rules: bool,
+    add_diff_scale: bool,
+) -> Iterator[bytes]:
+    """Yield a worksheet part as the shell head, one chunk per row, and the tail."""
+    text_rows = _stringify(headers, rows)
+    last_col = _column_letter(len(headers) or 1)
     sheet = Element(
         "worksheet",
         {
             "xmlns": "http://schemas.openxmlformats.org/spreadsheetml/2006/main",
             "xmlns:r": "http://schemas.openxmlformats.org/officeDocument/2006/relationships",
+            "dimension": f"A1:{last_col}{len(text_rows)}" if headers else "A1",
         },
     )
 
@@ -104,7 +202,7 @@ def _build_sheet_xml(title: str, rows: List[Sequence], add_risk_rules: bool, add
         },
     )
 
-    widths = _auto_width(rows)
+    widths = _auto_width(text_rows)
     if widths:
         cols = SubElement(sheet, "cols")
         for idx, width in enumerate(widths, start=1):
@@ -119,54 +217,17 @@ def _build_sheet_xml(title: str, rows: List[Sequence], add_risk_rules: bool, add
                 },
             )
 
-    sheet_data = SubElement(sheet, "sheetData")
-    for row_idx, row_values in enumerate(rows, start=1):
-        row = SubElement(sheet_data, "row", {"r": str(row_idx)})
-        for col_idx, value in enumerate(row_values, start=1):
-            cell_ref = f"{_column_letter(col_idx)}{row_idx}"
-            cell = SubElement(row, "c", {"r": cell_ref, "t": "inlineStr"})
-            is_elem = SubElement(cell, "is")
-            t_elem = SubElement(is_elem, "t")
-            text = "" if value is None else str(value)
-            t_elem.text = text
-
-    last_col = _column_letter(len(rows[0]) if rows else 1)
-    SubElement(sheet, "autoFilter", {"ref": f"A1:{last_col}1"})
+    # Cells are spliced in as raw bytes below; the tree only holds the shell.
+    SubElement(sheet, "sheetData")
 
-    if add_risk_rules:
-        cf = SubElement(sheet, "conditionalFormatting", {"sqref": "L2:L1048576"})
-        for idx, key in enumerate(("Low", "Med", "High")):
-            SubElement(
-                cf,
-                "cfRule",
-                {
-                    "type": "containsText",
-                    "operator": "containsText",
-                    "text": key,
-                    "dxfId": str(idx),
-                    "priority": str(idx + 1),
-                },
-            )
-            formula = SubElement(cf[-1], "formula")
-            formula.text = f'NOT(ISERROR(SEARCH("{key}",$L2)))'
-
-    if add_diff_scale:
-        cf = SubElement(sheet, "conditionalFormatting", {"sqref": "I2:I1048576"})
-        rule = SubElement(cf, "cfRule", {"type": "colorScale", "priority": "4"})
-        color_scale = SubElement(rule, "colorScale")
-        for value in ("10", "50", "90"):
-            SubElement(color_scale, "cfvo", {"type": "percentile", "val": value})
-        for color in ("FFFFFFFF", "FFFFF2CC", "FFFFC000"):
-            SubElement(color_scale, "color", {"rgb": color})
-
-    dimension = "A1"
-    if rows:
-        last_row = len(rows)
-        last_col_letter = _column_letter(len(rows[0]))
-        dimension = f"A1:{last_col_letter}{last_row}"
-    sheet.set("dimension", dimension)
+    SubElement(sheet, "autoFilter", {"ref": f"A1:{last_col}1"})
 
-    return tostring(sheet, encoding="utf-8", xml_declaration=True)
+    shell = tostring(sheet, encoding="utf-8", xml_declaration=True)
+    head, tail = shell.split(_SHEET_DATA_PLACEHOLDER, 1)
+    yield head
+    yield from _iter_sheet_data(text_rows)
+    rules = (_RISK_CF_XML if add_risk_rules else b"") + (_DIFF_CF_XML if add_diff_scale else b"")
+    yield tail.replace(b"</worksheet>", rules + b"</worksheet>")
 
 
 def _content_types_xml(sheet_count: int) -> bytes:
@@ -452,6 +513,29 @@ def _app_xml(sheet_titles: Sequence[str]) -> bytes:
     return tostring(props, encoding="utf-8", xml_declaration=True)
 
 
+# Sheet order, headers and conditional-formatting flags (risk fills, diff scale).
+_SHEET_LAYOUT = (
+    ("Picks", PICKS_HEADERS, True, True),
+    ("Player Props", PROPS_HEADERS, True, True),
+    ("Game Summary", GAME_SUMMARY_HEADERS, False, False),
+    ("Audit", AUDIT_HEADERS, False, False),
+)
+SHEET_TITLES = tuple(title for title, _, _, _ in _SHEET_LAYOUT)
+
+# Every workbook has the same four sheets, so all non-worksheet parts are
+# invariant and serialised once at import.
+_STATIC_PARTS = (
+    ("[Content_Types].xml", _content_types_xml(len(SHEET_TITLES))),
+    ("_rels/.rels", _rels_xml()),
+    ("docProps/core.xml", _core_xml()),
+    ("docProps/app.xml", _app_xml(SHEET_TITLES)),
+    ("xl/workbook.xml", _workbook_xml(SHEET_TITLES)),
+    ("xl/_rels/workbook.xml.rels", _workbook_rels_xml(len(SHEET_TITLES))),
+    ("xl/styles.xml", _styles_xml()),
+    ("xl/theme/theme1.xml", _theme_xml()),
+)
+
+
 class ExcelWriter:
     def __init__(self, output_dir: Path | None = None) -> None:
         self.output_dir = output_dir or Path(OUTPUT_DIR)
@@ -466,35 +550,30 @@ class ExcelWriter:
         summary_rows: Iterable[Sequence],
         audit_rows: Iterable[Sequence],
     ) -> Path:
-        picks_data = [PICKS_HEADERS, *picks_rows]
-        props_data = [PROPS_HEADERS, *props_rows]
-        summary_data = [GAME_SUMMARY_HEADERS, *summary_rows]
-        audit_data = [AUDIT_HEADERS, *audit_rows]
-
-        sheets = [
-            ("Picks", picks_data, True, True),
-            ("Player Props", props_data, True, True),
-            ("Game Summary", summary_data, False, False),
-            ("Audit", audit_data, False, False),
-        ]
+        # Rows are matched to their sheet by title; each iterable is consumed once.
+        rows_by_title = {
+            "Picks": picks_rows,
+            "Player Props": props_rows,
+            "Game Summary": summary_rows,
+            "Audit": audit_rows,
+        }
 
         conference_suffix = conference.capitalize()
         filename = f"NBA_{file_date:%Y-%m-%d}_{conference_suffix}.xlsx"
         output_path = self.output_dir / filename
 
-        with ZipFile(output_path, "w") as zf:
-            zf.writestr("[Content_Types].xml", _content_types_xml(len(sheets)))
-            zf.writestr("_rels/.rels", _rels_xml())
-            zf.writestr("docProps/core.xml", _core_xml())
-            zf.writestr("docProps/app.xml", _app_xml([title for title, *_ in sheets]))
-            zf.writestr("xl/workbook.xml", _workbook_xml([title for title, *_ in sheets]))
-            zf.writestr("xl/_rels/workbook.xml.rels", _workbook_rels_xml(len(sheets)))
-            zf.writestr("xl/styles.xml", _styles_xml())
-            zf.writestr("xl/theme/theme1.xml", _theme_xml())
-            for idx, (title, data, risk, diff) in enumerate(sheets, start=1):
-                zf.writestr(
-                    f"xl/worksheets/sheet{idx}.xml",
-                    _build_sheet_xml(title, data, add_risk_rules=risk, add_diff_scale=diff),
-                )
+        with ZipFile(output_path, "w", compression=ZIP_DEFLATED, compresslevel=6) as zf:
+            for name, part in _STATIC_PARTS:
+                zf.writestr(name, part)
+            for idx, (title, headers, risk, diff) in enumerate(_SHEET_LAYOUT, start=1):
+                with zf.open(f"xl/worksheets/sheet{idx}.xml", "w") as fp:
+                    for chunk in _iter_sheet_xml_chunks(
+                        title,
+                        headers,
+                        rows_by_title[title],
+                        add_risk_rules=risk,
+                        add_diff_scale=diff,
+                    ):
+                        fp.write(chunk)
 
         return output_path
@@ -1,11 +1,12 @@
 """SQLite-backed TTL cache."""
 from __future__ import annotations
 
-import json
 import sqlite3
 import time
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, Iterable, Optional, Tuple
+
+from hoops_edge.utils.jsonio import dumps, loads
 
 
 def _ensure_tables(conn: sqlite3.Connection) -> None:
@@ -13,7 +14,7 @@ def _ensure_tables(conn: sqlite3.Connection) -> None:
         """
         CREATE TABLE IF NOT EXISTS cache (
             key TEXT PRIMARY KEY,
-            value TEXT NOT NULL,
+            value BLOB NOT NULL,
             expires REAL NOT NULL
         )
         """
@@ -26,7 +27,13 @@ class TTLCache:
         self.path = path
         self.path.parent.mkdir(parents=True, exist_ok=True)
         self.conn = sqlite3.connect(self.path)
+        # WAL with synchronous=NORMAL avoids an fsync on every commit; a crash
+        # can only lose the most recent writes, which is fine for a cache.
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.execute("PRAGMA temp_store=MEMORY")
         _ensure_tables(self.conn)
+        self.purge_expired()
 
     def get(self, key: str) -> Optional[Any]:
         cur = self.conn.execute("SELECT value, expires FROM cache WHERE key = ?", (key,))
@@ -35,22 +42,34 @@ class TTLCache:
             return None
         value, expires = row
         if expires < time.time():
-            self.delete(key)
+            # Expired rows are left for purge_expired() so reads never write.
             return None
-        return json.loads(value)
+        # Rows written before values became BLOBs come back as str; loads takes both.
+        return loads(value)
 
     def set(self, key: str, value: Any, ttl: float) -> None:
         expires = time.time() + ttl
         self.conn.execute(
             "REPLACE INTO cache (key, value, expires) VALUES (?, ?, ?)",
-            (key, json.dumps(value), expires),
+            (key, dumps(value), expires),
         )
         self.conn.commit()
 
+    def set_many(self, items: Iterable[Tuple[str, Any, float]]) -> None:
+        """Store ``(key, value, ttl)`` items in a single transaction."""
+        now = time.time()
+        rows = [(key, dumps(value), now + ttl) for key, value, ttl in items]
+        with self.conn:
+            self.conn.executemany("REPLACE INTO cache (key, value, expires) VALUES (?, ?, ?)", rows)
+
     def delete(self, key: str) -> None:
         self.conn.execute("DELETE FROM cache WHERE key = ?", (key,))
         self.conn.commit()
 
+    def purge_expired(self) -> None:
+        self.conn.execute("DELETE FROM cache WHERE expires < ?", (time.time(),))
+        self.conn.commit()
+
     def clear(self) -> None:
         self.conn.execute("DELETE FROM cache")
         self.conn.commit()
@@ -0,0 +1,28 @@
+"""JSON encoding and decoding that use orjson when it is installed."""
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # orjson is an optional extra
+    orjson = None
+
+if orjson is not None:
+    loads = orjson.loads
+
+    def dumps(value: Any) -> bytes:
+        return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS)
+
+else:
+    loads = json.loads
+
+    def dumps(value: Any) -> bytes:
+        return json.dumps(value).encode("utf-8")
+
+
+def load_path(path: Path) -> Any:
+    """Parse the JSON document stored at *path*."""
+    return loads(path.read_bytes())
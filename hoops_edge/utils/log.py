@@ -2,7 +2,7 @@
 from __future__ import annotations
 
 import sys
-from typing import Iterable
+from typing import Iterable, TextIO
 
 COLORS = {
     "green": "\033[92m",
@@ -12,23 +12,40 @@ COLORS = {
 }
 
 
-def _colorize(text: str, color: str) -> str:
+def _isatty(stream: TextIO | None) -> bool:
+    # sys.stdout/sys.stderr are None under pythonw and some service runners.
+    return getattr(stream, "isatty", lambda: False)()
+
+
+# Colour only when a human is watching; redirected output stays ANSI-free.
+_IS_TTY_OUT = _isatty(sys.stdout)
+_IS_TTY_ERR = _isatty(sys.stderr)
+
+
+def _write(stream: TextIO | None, text: str) -> None:
+    if stream is not None:
+        stream.write(text)
+
+
+def _colorize(text: str, color: str, tty: bool) -> str:
+    if not tty:
+        return text
     return f"{COLORS.get(color, '')}{text}{COLORS['reset']}"
 
 
 def success(message: str) -> None:
-    print(_colorize(f"✅ {message}", "green"))
+    _write(sys.stdout, _colorize(f"✅ {message}", "green", _IS_TTY_OUT) + "\n")
 
 
 def warning(message: str) -> None:
-    print(_colorize(f"⚠️ {message}", "yellow"))
+    _write(sys.stdout, _colorize(f"⚠️ {message}", "yellow", _IS_TTY_OUT) + "\n")
 
 
 def error(message: str) -> None:
-    print(_colorize(f"❌ {message}", "red"), file=sys.stderr)
+    _write(sys.stderr, _colorize(f"❌ {message}", "red", _IS_TTY_ERR) + "\n")
 
 
 def bullet_list(title: str, items: Iterable[str]) -> None:
-    print(_colorize(title, "green"))
-    for idx, item in enumerate(items, start=1):
-        print(f"  {idx}. {item}")
+    lines = [_colorize(title, "green", _IS_TTY_OUT)]
+    lines.extend(f"  {idx}. {item}" for idx, item in enumerate(items, start=1))
+    _write(sys.stdout, "\n".join(lines) + "\n")
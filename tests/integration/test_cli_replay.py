@@ -7,9 +7,9 @@ from zipfile import ZipFile
 NS = {"main": "http://schemas.openxmlformats.org/spreadsheetml/2006/main"}
 
 
-def _sheet_rows(path):
+def _sheet_rows(path, sheet_index=1):
     with ZipFile(path) as zf:
-        sheet_xml = zf.read("xl/worksheets/sheet1.xml")
+        sheet_xml = zf.read(f"xl/worksheets/sheet{sheet_index}.xml")
     root = ET.fromstring(sheet_xml)
     return list(root.find("main:sheetData", NS).findall("main:row", NS))
 
@@ -41,3 +41,56 @@ def test_cli_replay(tmp_path):
 
     rows = _sheet_rows(output_path)
     assert len(rows) >= 2
+
+
+def _row_texts(row):
+    return [cell.find("main:is", NS).find("main:t", NS).text for cell in row.findall("main:c", NS)]
+
+
+def test_cli_replay_multi_game_order(tmp_path):
+    output_path = Path("outputs/NBA_2024-02-24_All.xlsx")
+    if output_path.exists():
+        output_path.unlink()
+
+    # MIA@ATL has no spread and PHX@CHI quotes only a spread.
+    subprocess.run(
+        [
+            "python",
+            "-m",
+            "hoops_edge",
+            "scan",
+            "--date",
+            "2024-02-24",
+            "--conf",
+            "all",
+            "--replay",
+            "odds=tests/fixtures/odds/2024-02-24_multi.json",
+        ],
+        check=True,
+        capture_output=True,
+        text=True,
+    )
+
+    expected = [
+        ("BOS@NYK_2024-02-24", "ML"),
+        ("BOS@NYK_2024-02-24", "Spread"),
+        ("BOS@NYK_2024-02-24", "Total"),
+        ("MIA@ATL_2024-02-24", "ML"),
+        ("MIA@ATL_2024-02-24", "Total"),
+        ("LAL@DEN_2024-02-24", "ML"),
+        ("LAL@DEN_2024-02-24", "Spread"),
+        ("LAL@DEN_2024-02-24", "Total"),
+        ("PHX@CHI_2024-02-24", "Spread"),
+    ]
+    audit = [tuple(_row_texts(row)[:2]) for row in _sheet_rows(output_path, 4)[1:]]
+    assert audit[: len(expected)] == expected
+    assert all(market.startswith("Prop-") for _, market in audit[len(expected) :])
+
+    matchups = {
+        "BOS@NYK_2024-02-24": "Boston Celtics @ New York Knicks",
+        "MIA@ATL_2024-02-24": "Miami Heat @ Atlanta Hawks",
+        "LAL@DEN_2024-02-24": "Los Angeles Lakers @ Denver Nuggets",
+        "PHX@CHI_2024-02-24": "Phoenix Suns @ Chicago Bulls",
+    }
+    picks = [tuple(_row_texts(row)[1:3]) for row in _sheet_rows(output_path, 1)[1:]]
+    assert picks == [(matchups[game_id], market) for game_id, market in expected]
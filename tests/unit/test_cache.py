@@ -0,0 +1,18 @@
+from hoops_edge.utils.cache import TTLCache
+
+
+def test_set_many_round_trip(tmp_path):
+    cache = TTLCache(tmp_path / "cache.sqlite")
+    cache.set_many([("odds", {"home": -110}, 60), ("stats", [1, 2, 3], 60)])
+    assert cache.get("odds") == {"home": -110}
+    assert cache.get("stats") == [1, 2, 3]
+    cache.close()
+
+
+def test_expired_entries_are_hidden_then_purged(tmp_path):
+    cache = TTLCache(tmp_path / "cache.sqlite")
+    cache.set("stale", "value", -1)
+    assert cache.get("stale") is None
+    cache.purge_expired()
+    assert cache.conn.execute("SELECT COUNT(*) FROM cache").fetchone()[0] == 0
+    cache.close()
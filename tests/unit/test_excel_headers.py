@@ -47,3 +47,17 @@ def test_excel_headers(tmp_path):
     assert _sheet_headers(path, 2) == PICKS_HEADERS
     assert _sheet_headers(path, 3) == GAME_SUMMARY_HEADERS
     assert _sheet_headers(path, 4) == AUDIT_HEADERS
+
+
+def test_excel_numeric_and_empty_cells(tmp_path):
+    writer = ExcelWriter(output_dir=tmp_path)
+    summary = [["7:00 PM", "BOS @ NYK", "east", 212.5, 3, None, "", "", "", ""]]
+    path = writer.write(datetime(2024, 2, 24), "east", [], [], summary, [])
+    with ZipFile(path) as zf:
+        root = ET.fromstring(zf.read("xl/worksheets/sheet3.xml"))
+    row = root.find("main:sheetData", NS).findall("main:row", NS)[1]
+    cells = {cell.attrib["r"]: cell for cell in row.findall("main:c", NS)}
+    assert sorted(cells) == ["A2", "B2", "C2", "D2", "E2"]
+    assert cells["D2"].find("main:v", NS).text == "212.5"
+    assert cells["E2"].find("main:v", NS).text == "3"
+    assert cells["A2"].find("main:is", NS).find("main:t", NS).text == "7:00 PM"
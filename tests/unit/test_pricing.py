@@ -1,4 +1,14 @@
-from hoops_edge.models.pricing import american_to_probability, probability_to_american
+from hoops_edge.models.pricing import (
+    american_to_probability,
+    classify_risk,
+    compare_line_market,
+    compare_line_market_batch,
+    compare_probability_market,
+    compare_probability_market_batch,
+    devig_two_way,
+    kelly_fraction,
+    probability_to_american,
+)
 
 
 def test_round_trip_conversion():
@@ -6,3 +16,46 @@ def test_round_trip_conversion():
     odds = probability_to_american(prob)
     assert isinstance(odds, int)
     assert odds < 0
+
+
+def test_probability_market_batch_matches_helpers():
+    model_probs = [0.52, 0.31, 0.7]
+    prices_a = [-135, 120, -110]
+    prices_b = [115, -145, -110]
+    for side in ("home", "away"):
+        batch = compare_probability_market_batch(model_probs, prices_a, prices_b, side)
+        for result, prob, a, b in zip(batch, model_probs, prices_a, prices_b):
+            devig_a, devig_b = devig_two_way(a, b)
+            book_prob, odds = (devig_a, a) if side == "home" else (devig_b, b)
+            assert result.book_value == book_prob
+            assert result.edge == prob - book_prob
+            assert result.kelly == kelly_fraction(prob, odds)
+            assert result.risk == classify_risk(abs(prob - book_prob))
+        assert compare_probability_market(model_probs[0], prices_a[0], prices_b[0], side) == batch[0]
+
+
+def test_line_market_batch_matches_helpers():
+    model_lines = [0.39, 212.9, -7.2]
+    book_lines = [-2.5, 222.5, -6.5]
+    prices_a = [-110, -105, -108]
+    prices_b = [-110, -115, -112]
+    for side in ("home", "under"):
+        batch = compare_line_market_batch(model_lines, book_lines, prices_a, prices_b, side)
+        for result, model, book, a, b in zip(batch, model_lines, book_lines, prices_a, prices_b):
+            model_prob = max(0.01, min(0.99, 0.5 + (model - book) / 10))
+            assert result.diff == abs(model - book)
+            assert result.edge == model_prob - devig_two_way(a, b)[0]
+            assert result.kelly == kelly_fraction(model_prob, a if side == "home" else b)
+            assert result.risk == classify_risk(abs(model - book), is_line=True)
+        assert compare_line_market(model_lines[0], book_lines[0], prices_a[0], prices_b[0], side) == batch[0]
+
+
+def test_classify_risk_bands_are_inclusive():
+    assert classify_risk(0.02) == "Low"
+    assert classify_risk(0.05) == "Med"
+    assert classify_risk(0.0501) == "High"
+    assert classify_risk(0.5, is_line=True) == "Low"
+    assert classify_risk(1.5, is_line=True) == "Med"
+    assert classify_risk(1.51, is_line=True) == "High"
+    assert classify_risk(float("nan")) == "High"
+    assert classify_risk(float("nan"), is_line=True) == "High"
@@ -0,0 +1,29 @@
+from hoops_edge.ingest.props_provider import PlayerProp
+from hoops_edge.ingest.stats_provider import NBAStatsProvider
+from hoops_edge.models._kernels import fair_over_probabilities
+from hoops_edge.models.simulator import normal_cdf, simulate_props
+
+
+def test_fair_over_matches_normal_cdf():
+    means, sigmas, lines = [26.0, 8.1, 2.0], [4.7, 1.5, 1.5], [26.5, 8.5, 0.5]
+    for fair, mean, sigma, line in zip(fair_over_probabilities(means, sigmas, lines), means, sigmas, lines):
+        assert abs(fair - (1 - normal_cdf(line, mean, sigma))) < 1e-12
+
+
+def test_simulate_props_keeps_prop_order_across_markets():
+    provider = NBAStatsProvider()
+    team_stats = provider.fetch_team_stats(["New York Knicks"])
+    player_stats = provider.fetch_player_stats(["A", "B", "C"])
+    props = [
+        PlayerProp("g1", "A", "points", 20.5, -110, -110, "DK"),
+        PlayerProp("g1", "Missing", "points", 20.5, -110, -110, "DK"),
+        PlayerProp("g1", "B", "rebounds", 6.5, -110, -110, "DK"),
+        PlayerProp("g1", "C", "points", 18.5, -110, -110, "DK"),
+    ]
+    projections = simulate_props(props, player_stats, team_stats, {"g1": "New York Knicks"})
+    assert [(p.prop.player, p.prop.market) for p in projections] == [
+        ("A", "points"),
+        ("B", "rebounds"),
+        ("C", "points"),
+    ]
+    assert [p.prop for p in projections] == [props[0], props[2], props[3]]